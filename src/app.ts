@@ -78,8 +78,12 @@ program
 
 // begin processing input 
 program.parse();
-console.log('Options: ', program.opts());
-console.log('Remaining arguments: ', program.args);
+
+// only dump parsed state in debug mode
+if (program.opts().debug) {
+  console.log('Options: ', program.opts());
+  console.log('Remaining arguments: ', program.args);
+}
 
 // exit cli
 process.exit();
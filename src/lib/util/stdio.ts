@@ -1,6 +1,7 @@
 import * as readline from 'readline';
 
-const rl = readline.createInterface(process.stdin, process.stdout);
+// created on first use so non-interactive commands never open stdin
+let rl: readline.Interface | undefined;
 
 const stdio = {
 
@@ -11,10 +12,15 @@ const stdio = {
 
   // define repl for interactive mode
   repl() {
+    if (!rl) {
+      rl = readline.createInterface(process.stdin, process.stdout);
+    }
+
     rl.question("lsh interactive (type 'q' to exit): ",
       (command: string) => {
         if (command === 'q') {
-          rl.close();
+          rl?.close();
+          rl = undefined;
           return;
         }
 